@@ -1,14 +1,37 @@
 import streamlit as st
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import csv
+import io
+import hashlib
 from openai import AzureOpenAI
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 import time
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from urllib.parse import urlparse
 import os
 from dotenv import load_dotenv
 
+# orjson parses SERP/LLM payloads faster; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 # Load environment variables
 load_dotenv()
 
@@ -20,8 +43,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS, emitted by run() on every rerun
+CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -30,39 +53,272 @@ st.markdown("""
         margin-bottom: 2rem;
         font-weight: bold;
     }
-    .job-card {
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        background-color: #f8f9fa;
-    }
-    .company-card {
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        background-color: #fff;
+</style>
+"""
+
+@st.cache_resource
+def get_http_session() -> requests_cache.CachedSession:
+    """Create a pooled, disk-cached HTTP session shared across Streamlit reruns"""
+    session = requests_cache.CachedSession(
+        ".serp_cache",
+        backend="sqlite",
+        expire_after=86400,
+        allowable_codes=[200],
+        ignored_parameters=["api_key", "no_cache"]  # A forced refresh overwrites the normal entry
+    )
+    retries = Retry(
+        total=4,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@st.cache_resource
+def get_azure_client(endpoint: str, api_version: str, api_key_hash: str, _api_key: str) -> AzureOpenAI:
+    """Create an Azure OpenAI client once per configuration so its connection pool survives reruns"""
+    return AzureOpenAI(
+        api_key=_api_key,
+        api_version=api_version,
+        azure_endpoint=endpoint
+    )
+
+def serp_get(params: Dict, fresh: bool = False) -> Dict:
+    """Call the SERP API, raising on non-200 responses so they are never cached
+
+    SerpAPI serves identical searches from its free one-hour cache; fresh=True bypasses
+    both that and the local HTTP cache.
+    """
+    if fresh:
+        params = {**params, "no_cache": "true"}
+    
+    def fetch() -> Dict:
+        response = get_http_session().get("https://serpapi.com/search", params=params, timeout=20, force_refresh=fresh)
+        response.raise_for_status()
+        return json_loads(response.content)
+    
+    # A double-clicked search or a second session asking the same thing waits for the first request
+    key = "serp:" + hashlib.sha256(json_dumps(sorted(params.items())).encode()).hexdigest()
+    return get_inflight().do(key, fetch)
+
+def fetch_serp_jobs(query: str, location: str, num: int, api_key: str, fresh: bool = False) -> List[Dict]:
+    """Fetch raw Google Jobs results"""
+    params = {
+        "engine": "google_jobs",
+        "q": query,
+        "location": location,
+        "api_key": api_key,
+        "num": num
     }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        text-align: center;
+    return serp_get(params, fresh).get("jobs_results", [])
+
+def fetch_serp_organic(query: str, num: int, api_key: str, fresh: bool = False) -> List[Dict]:
+    """Fetch raw Google organic results"""
+    params = {
+        "engine": "google",
+        "q": query,
+        "api_key": api_key,
+        "num": num,
+        "gl": "us",
+        "hl": "en"
     }
-</style>
-""", unsafe_allow_html=True)
+    return serp_get(params, fresh).get("organic_results", [])
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=128)
+def _serp_jobs_raw(api_key_hash: str, query: str, location: str, num: int, _api_key: str) -> List[Dict]:
+    """Cached fetch_serp_jobs, keyed on the query and a hash of the API key"""
+    return fetch_serp_jobs(query, location, num, _api_key)
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=128)
+def _serp_career_raw(api_key_hash: str, query: str, num: int, _api_key: str) -> List[Dict]:
+    """Cached fetch_serp_organic, keyed on the query and a hash of the API key"""
+    return fetch_serp_organic(query, num, _api_key)
+
+class LLMCache:
+    """Thread-safe in-memory store of parsed LLM replies with a TTL"""
+    
+    def __init__(self, ttl: int = 3600, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """Return the cached reply for key, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() - entry[0] < self.ttl:
+                return entry[1]
+            return None
+    
+    def set(self, key: str, value: Any):
+        """Store a reply, evicting the oldest entry when full"""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.time(), value)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+@st.cache_resource
+def get_llm_cache() -> LLMCache:
+    """Share one LLM reply cache across reruns and sessions"""
+    return LLMCache()
+
+@st.cache_resource
+def get_career_verdicts() -> LLMCache:
+    """Share per-URL career page scores from earlier AI validations"""
+    return LLMCache(ttl=86400, max_entries=4096)
+
+def llm_cache_key(model: str, system_prompt: str, prompt: str) -> str:
+    """Hash everything that determines an LLM reply into a cache key"""
+    return hashlib.sha256(json_dumps({"model": model, "system": system_prompt, "prompt": prompt}).encode()).hexdigest()
+
+class SingleFlight:
+    """Let concurrent callers with the same key share one in-flight call"""
+    
+    def __init__(self):
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the identical call another rerun/session already started"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as exc:
+            # Streamlit stops superseded runs with BaseExceptions; waiters only need to know it failed
+            future.set_exception(exc if isinstance(exc, Exception) else RuntimeError("Shared request was interrupted"))
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+@st.cache_resource
+def get_inflight() -> SingleFlight:
+    """Share one in-flight registry across reruns and sessions (module globals reset on rerun)"""
+    return SingleFlight()
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=128)
+def career_pages_table(career_pages: List[Dict]) -> pd.DataFrame:
+    """Build the display table for a result set once instead of on every widget rerun"""
+    df = pd.DataFrame.from_records(career_pages)[
+        ['company_name', 'domain', 'industry', 'company_size', 'career_url']
+    ].rename(columns={
+        'company_name': "Company",
+        'domain': "Domain",
+        'industry': "Industry",
+        'company_size': "Size",
+        'career_url': "Career URL"
+    })
+    df['Size'] = df['Size'].str.split(" (", n=1, regex=False).str[0]  # Shorter display
+    
+    # Arrow-backed strings skip the object -> Arrow conversion in st.dataframe; categories make isin filters cheap
+    return df.astype({
+        "Company": "string[pyarrow]",
+        "Domain": "string[pyarrow]",
+        "Industry": "category",
+        "Size": "category",
+        "Career URL": "string[pyarrow]"
+    })
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=128)
+def career_pages_csv(career_pages: List[Dict]) -> bytes:
+    """Encode career pages as CSV once per distinct result set"""
+    # Every record has the same keys, so write rows directly instead of going through a DataFrame
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(career_pages[0]) if career_pages else [], lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(career_pages)
+    return buffer.getvalue().encode()
 
 class JobHunterApp:
+    # Search keywords used to build the career page discovery query
+    SIZE_KEYWORDS = {
+        "MNCs (Large Corporations)": "Fortune 500 OR multinational OR corporation OR large company OR enterprise",
+        "Startups (Small to Medium)": "startup OR emerging company OR scale-up OR tech company OR innovation"
+    }
+
+    INDUSTRY_KEYWORDS = {
+        "Technology & Software": "software OR technology OR IT OR tech OR SaaS OR cloud OR AI OR data science",
+        "Financial Services & Fintech": "bank OR financial OR fintech OR investment OR trading OR insurance OR payments",
+        "Healthcare & Biotechnology": "healthcare OR biotech OR pharmaceutical OR medical OR health tech OR life sciences",
+        "E-commerce & Retail": "ecommerce OR retail OR marketplace OR shopping OR consumer goods OR fashion",
+        "Consulting & Professional Services": "consulting OR advisory OR professional services OR strategy OR management",
+        "Manufacturing & Automotive": "manufacturing OR automotive OR industrial OR machinery OR production OR engineering",
+        "Media & Entertainment": "media OR entertainment OR content OR streaming OR publishing OR creative",
+        "Energy & Utilities": "energy OR utilities OR renewable OR oil OR gas OR power OR electricity",
+        "Real Estate & Construction": "real estate OR construction OR property OR architecture OR development",
+        "Education & EdTech": "education OR edtech OR learning OR training OR university OR academic",
+        "Food & Beverage": "food OR beverage OR restaurant OR hospitality OR culinary OR agriculture",
+        "Transportation & Logistics": "logistics OR transportation OR supply chain OR shipping OR delivery",
+        "Telecommunications": "telecom OR telecommunications OR wireless OR network OR connectivity",
+        "Gaming & Digital Entertainment": "gaming OR game development OR digital entertainment OR esports",
+        "Aerospace & Defense": "aerospace OR defense OR aviation OR space OR military OR aircraft"
+    }
+    
+    # Job search parameters
+    EMPLOYMENT_TYPES = ("Full-time", "Part-time", "Contract", "Internship", "Temporary")
+    WORK_MODES = ("Remote", "On-site", "Hybrid")
+    EXPERIENCE_LEVELS = ("Entry Level", "Mid Level", "Senior Level", "Executive")
+    
+    # Industry domains and company size categories for career page discovery
+    INDUSTRY_DOMAINS = tuple(INDUSTRY_KEYWORDS)
+    COMPANY_SIZES = tuple(SIZE_KEYWORDS)
+    
+    # Career page indicators, compiled once into single alternation patterns
+    CAREER_URL_KEYWORDS = (
+        "career", "careers", "job", "jobs", "hiring", "employment",
+        "talent", "work", "opportunity", "join", "apply", "openings"
+    )
+    CAREER_TITLE_KEYWORDS = (
+        "career", "careers", "job", "jobs", "hiring", "employment",
+        "work at", "join", "talent", "opportunities"
+    )
+    CAREER_URL_RE = re.compile("|".join(map(re.escape, CAREER_URL_KEYWORDS)))
+    CAREER_TITLE_RE = re.compile("|".join(map(re.escape, CAREER_TITLE_KEYWORDS)))
+    CAREER_CONTENT_RE = re.compile("|".join(map(re.escape, CAREER_URL_KEYWORDS[:6])))  # More selective for content
+    
+    # Ids in a streamed LLM reply, counted once the next character shows the number is complete
+    PICKED_COMPANY_ID_RE = re.compile(r'"id"\s*:\s*(\d+)(?=\D)')
+    PICKED_JOB_ID_RE = re.compile(r"(\d+)(?=\D)")
+    
+    # Job boards, recruiters, etc. that are never a company's own career page
+    EXCLUDE_PATTERNS = (
+        "indeed", "linkedin", "glassdoor", "monster", "ziprecruiter",
+        "simplyhired", "careerbuilder", "dice", "recruiter", "recruitment",
+        "staffing", "headhunter", "talent agency", "consulting"
+    )
+    
     def __init__(self):
+        self.use_cached_results = True
+        self.llm_cache = get_llm_cache()
+        self.career_verdicts = get_career_verdicts()
+        self.inflight = get_inflight()  # Resolved here: cache_resource needs the script thread, workers use this
         self.setup_api_keys()
-        self.setup_constants()
     
     def setup_api_keys(self):
         """Setup API keys and Azure OpenAI configuration from .env or sidebar"""
         # SERP API
         self.serp_api_key = os.getenv("SERP_API_KEY")
+        # Hashed key is used in cache keys so the secret itself is never stored
+        self.serp_api_key_hash = hashlib.sha256(self.serp_api_key.encode()).hexdigest()[:8] if self.serp_api_key else ""
         
         # Azure OpenAI API
         self.azure_openai_api_key = os.getenv("AZURE_OPENAI_API_KEY")
@@ -74,10 +330,11 @@ class JobHunterApp:
         self.azure_client = None
         if all([self.azure_openai_api_key, self.azure_openai_endpoint, self.azure_openai_deployment]):
             try:
-                self.azure_client = AzureOpenAI(
-                    api_key=self.azure_openai_api_key,
-                    api_version=self.azure_openai_api_version,
-                    azure_endpoint=self.azure_openai_endpoint
+                self.azure_client = get_azure_client(
+                    self.azure_openai_endpoint,
+                    self.azure_openai_api_version,
+                    hashlib.sha256(self.azure_openai_api_key.encode()).hexdigest()[:8],
+                    _api_key=self.azure_openai_api_key
                 )
                 st.success("✅ Azure OpenAI configured successfully!")
             except Exception as e:
@@ -85,85 +342,62 @@ class JobHunterApp:
         elif any([self.azure_openai_api_key, self.azure_openai_endpoint, self.azure_openai_deployment]):
             st.warning("⚠️ Please fill in all Azure OpenAI fields")
     
-    def setup_constants(self):
-        """Setup company lists and job search parameters"""
-        self.employment_types = [
-            "Full-time", "Part-time", "Contract", "Internship", "Temporary"
-        ]
-        
-        self.work_modes = [
-            "Remote", "On-site", "Hybrid"
-        ]
-        
-        self.experience_levels = [
-            "Entry Level", "Mid Level", "Senior Level", "Executive"
-        ]
-        
-        # Industry domains for career page discovery
-        self.industry_domains = [
-            "Technology & Software",
-            "Financial Services & Fintech",
-            "Healthcare & Biotechnology",
-            "E-commerce & Retail",
-            "Consulting & Professional Services",
-            "Manufacturing & Automotive",
-            "Media & Entertainment",
-            "Energy & Utilities",
-            "Real Estate & Construction",
-            "Education & EdTech",
-            "Food & Beverage",
-            "Transportation & Logistics",
-            "Telecommunications",
-            "Gaming & Digital Entertainment",
-            "Aerospace & Defense"
-        ]
-        
-        # Company size categories
-        self.company_sizes = ["MNCs (Large Corporations)", "Startups (Small to Medium)"]
+    @staticmethod
+    def canonical_query(position: str, employment_type: str, work_mode: str) -> str:
+        """Build the job search query in one canonical form so equivalent inputs share cache entries"""
+        query_parts = [" ".join(position.lower().split())]
+        if employment_type != "Any":
+            query_parts.append(employment_type.lower())
+        if work_mode == "Remote":
+            query_parts.append("remote")
+        return " ".join(query_parts)
     
-    def search_serp_jobs(self, query: str, location: str = "", num_results: int = 20) -> List[Dict]:
-        """Search for jobs using SERP API"""
+    def search_serp_jobs(self, query: str, location: str = "", num_results: int = 20, limit: int = None) -> List[Dict]:
+        """Search for jobs using SERP API, fetching and cleaning up to `limit` results (defaults to num_results)
+
+        A limit above num_results gives AI ranking a larger candidate pool to choose from.
+        """
         if not self.serp_api_key:
             st.error("Please provide SERP API key")
             return []
         
         try:
-            params = {
-                "engine": "google_jobs",
-                "q": query,
-                "location": location,
-                "api_key": self.serp_api_key,
-                "num": min(num_results, 100)  # SERP API limit
+            num = min(limit or num_results, 100)  # SERP API limit
+            if self.use_cached_results:
+                jobs = _serp_jobs_raw(self.serp_api_key_hash, query, location, num, _api_key=self.serp_api_key)
+            else:
+                jobs = fetch_serp_jobs(query, location, num, self.serp_api_key, fresh=True)
+            
+            # Clean and structure job data in one columnar pass
+            column_map = {
+                "title": "title",
+                "company_name": "company",
+                "location": "location",
+                "description": "description",
+                "via": "via",
+                "link": "link",
+                "thumbnail": "thumbnail",
+                "detected_extensions_posted_at": "posted_at",
+                "detected_extensions_schedule_type": "schedule_type",
+                "detected_extensions_work_from_home": "work_from_home"
             }
+            jobs_df = (
+                pd.json_normalize(jobs, sep="_")
+                .reindex(columns=list(column_map))
+                .rename(columns=column_map)
+            )
+            jobs_df = jobs_df.fillna({col: "" for col in jobs_df.columns if col != "work_from_home"})
+            jobs_df["work_from_home"] = jobs_df["work_from_home"].fillna(False).astype(bool)
             
-            response = requests.get("https://serpapi.com/search", params=params)
+            # The same posting is often syndicated across several boards; keep its first listing
+            dedup_key = jobs_df[["title", "company", "location"]].apply(lambda col: col.str.strip().str.lower())
+            jobs_df = jobs_df[~dedup_key.duplicated()].head(limit or num_results).reset_index(drop=True)
             
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get("jobs_results", [])
-                
-                # Clean and structure job data
-                cleaned_jobs = []
-                for job in jobs:
-                    cleaned_job = {
-                        "title": job.get("title", ""),
-                        "company": job.get("company_name", ""),
-                        "location": job.get("location", ""),
-                        "description": job.get("description", ""),
-                        "via": job.get("via", ""),
-                        "link": job.get("link", ""),
-                        "thumbnail": job.get("thumbnail", ""),
-                        "posted_at": job.get("detected_extensions", {}).get("posted_at", ""),
-                        "schedule_type": job.get("detected_extensions", {}).get("schedule_type", ""),
-                        "work_from_home": job.get("detected_extensions", {}).get("work_from_home", False)
-                    }
-                    cleaned_jobs.append(cleaned_job)
-                
-                return cleaned_jobs
-            else:
-                st.error(f"SERP API Error: {response.status_code}")
-                return []
-                
+            return jobs_df.to_dict("records")
+        
+        except requests.HTTPError as e:
+            st.error(f"SERP API Error: {e.response.status_code}")
+            return []
         except Exception as e:
             st.error(f"Error searching jobs: {str(e)}")
             return []
@@ -175,33 +409,9 @@ class JobHunterApp:
             return []
         
         try:
-            # Build comprehensive search query
-            size_keywords = {
-                "MNCs (Large Corporations)": "Fortune 500 OR multinational OR corporation OR large company OR enterprise",
-                "Startups (Small to Medium)": "startup OR emerging company OR scale-up OR tech company OR innovation"
-            }
-            
-            industry_keywords = {
-                "Technology & Software": "software OR technology OR IT OR tech OR SaaS OR cloud OR AI OR data science",
-                "Financial Services & Fintech": "bank OR financial OR fintech OR investment OR trading OR insurance OR payments",
-                "Healthcare & Biotechnology": "healthcare OR biotech OR pharmaceutical OR medical OR health tech OR life sciences",
-                "E-commerce & Retail": "ecommerce OR retail OR marketplace OR shopping OR consumer goods OR fashion",
-                "Consulting & Professional Services": "consulting OR advisory OR professional services OR strategy OR management",
-                "Manufacturing & Automotive": "manufacturing OR automotive OR industrial OR machinery OR production OR engineering",
-                "Media & Entertainment": "media OR entertainment OR content OR streaming OR publishing OR creative",
-                "Energy & Utilities": "energy OR utilities OR renewable OR oil OR gas OR power OR electricity",
-                "Real Estate & Construction": "real estate OR construction OR property OR architecture OR development",
-                "Education & EdTech": "education OR edtech OR learning OR training OR university OR academic",
-                "Food & Beverage": "food OR beverage OR restaurant OR hospitality OR culinary OR agriculture",
-                "Transportation & Logistics": "logistics OR transportation OR supply chain OR shipping OR delivery",
-                "Telecommunications": "telecom OR telecommunications OR wireless OR network OR connectivity",
-                "Gaming & Digital Entertainment": "gaming OR game development OR digital entertainment OR esports",
-                "Aerospace & Defense": "aerospace OR defense OR aviation OR space OR military OR aircraft"
-            }
-            
             # Single comprehensive query
-            industry_terms = industry_keywords.get(industry, industry)
-            size_terms = size_keywords.get(company_size, "")
+            industry_terms = self.INDUSTRY_KEYWORDS.get(industry, industry)
+            size_terms = self.SIZE_KEYWORDS.get(company_size, "")
             
             # Build the query
             query_parts = [f"({industry_terms})"]
@@ -215,167 +425,145 @@ class JobHunterApp:
             
             final_query = " ".join(query_parts)
             
-            params = {
-                "engine": "google",
-                "q": final_query,
-                "api_key": self.serp_api_key,
-                "num": num_results,
-                "gl": "us",
-                "hl": "en"
-            }
-            
             st.info(f"🔍 **Single API Call Query:** `{final_query}`")
             
             with st.spinner("Making SERP API call..."):
-                response = requests.get("https://serpapi.com/search", params=params, timeout=20)
+                if self.use_cached_results:
+                    organic_results = _serp_career_raw(self.serp_api_key_hash, final_query, num_results, _api_key=self.serp_api_key)
+                else:
+                    organic_results = fetch_serp_organic(final_query, num_results, self.serp_api_key, fresh=True)
             
-            if response.status_code == 200:
-                data = response.json()
-                organic_results = data.get("organic_results", [])
-                
-                st.success(f"✅ **Single API Call Complete!** Retrieved {len(organic_results)} raw results")
-                
-                # Return all raw results for local filtering
-                raw_results = []
-                for result in organic_results:
-                    raw_result = {
-                        "title": result.get("title", ""),
-                        "url": result.get("link", ""),
-                        "snippet": result.get("snippet", ""),
-                        "displayed_link": result.get("displayed_link", ""),
-                        "position": result.get("position", 0),
-                        "search_query": final_query
-                    }
-                    raw_results.append(raw_result)
-                
-                return raw_results
+            st.success(f"✅ **Single API Call Complete!** Retrieved {len(organic_results)} raw results")
             
-            else:
-                st.error(f"SERP API Error: {response.status_code}")
-                if response.status_code == 429:
-                    st.error("Rate limit exceeded. Please wait and try again.")
-                return []
-                
+            # Return all raw results for local filtering
+            raw_results = []
+            for result in organic_results:
+                raw_result = {
+                    "title": result.get("title", ""),
+                    "url": result.get("link", ""),
+                    "snippet": result.get("snippet", ""),
+                    "displayed_link": result.get("displayed_link", ""),
+                    "position": result.get("position", 0),
+                    "search_query": final_query
+                }
+                raw_results.append(raw_result)
+            
+            return raw_results
+        
+        except requests.HTTPError as e:
+            st.error(f"SERP API Error: {e.response.status_code}")
+            if e.response.status_code == 429:
+                st.error("Rate limit exceeded. Please wait and try again.")
+            return []
         except Exception as e:
             st.error(f"Error making SERP API call: {str(e)}")
             return []
     
-    def filter_career_pages_locally(self, raw_results: List[Dict], criteria: Dict) -> List[Dict]:
-        """Filter career pages locally from raw SERP results"""
+    def filter_career_pages_locally(self, raw_results: List[Dict], criteria: Dict, limit: int = None) -> List[Dict]:
+        """Filter career pages locally from raw SERP results, keeping at most `limit` of the best (all by default)"""
         if not raw_results:
             return []
         
         st.info(f"🔄 **Local Filtering:** Processing {len(raw_results)} raw results...")
         
-        career_pages = []
-        excluded_domains = set()
         excluded_keywords = criteria.get('exclude_keywords', '').lower().split(',') if criteria.get('exclude_keywords') else []
-        excluded_keywords = [kw.strip() for kw in excluded_keywords if kw.strip()]
+        exclude_re = self.exclude_pattern(tuple(kw.strip() for kw in excluded_keywords if kw.strip()))
         
-        # Define career page indicators
-        career_url_keywords = [
-            "career", "careers", "job", "jobs", "hiring", "employment", 
-            "talent", "work", "opportunity", "join", "apply", "openings"
-        ]
+        # Criteria-derived values are the same for every result, so compute them once
+        industry = criteria.get('industry', 'Unknown')
+        company_size = criteria.get('company_size', 'Unknown')
+        industry_words = criteria.get('industry', '').lower().split('&')
+        size_terms = self.size_indicator_terms(criteria.get('company_size', ''))
         
-        career_title_keywords = [
-            "career", "careers", "job", "jobs", "hiring", "employment",
-            "work at", "join", "talent", "opportunities"
-        ]
+        # Check which results are likely career pages with vectorized string ops
+        results_df = pd.DataFrame(raw_results)
+        urls = results_df['url'].str.lower()
+        titles = results_df['title'].str.lower()
+        snippets = results_df['snippet'].str.lower()
+        is_career = (
+            urls.str.contains(self.CAREER_URL_RE)
+            | titles.str.contains(self.CAREER_TITLE_RE)
+            | snippets.str.contains(self.CAREER_CONTENT_RE)
+        )
         
-        # Define exclusion patterns (job boards, recruiters, etc.)
-        exclude_patterns = [
-            "indeed", "linkedin", "glassdoor", "monster", "ziprecruiter",
-            "simplyhired", "careerbuilder", "dice", "recruiter", "recruitment",
-            "staffing", "headhunter", "talent agency", "consulting"
-        ] + excluded_keywords
-        
-        for result in raw_results:
-            url = result['url'].lower()
-            title = result['title'].lower()
-            snippet = result['snippet'].lower()
-            domain = self.extract_domain(result['url'])
-            
-            # Check if it's likely a career page
-            is_career_url = any(keyword in url for keyword in career_url_keywords)
-            is_career_title = any(keyword in title for keyword in career_title_keywords)
-            has_career_content = any(keyword in snippet for keyword in career_url_keywords[:6])  # More selective for content
-            
-            # Check for exclusions
-            is_excluded = any(pattern in url or pattern in title or pattern in snippet for pattern in exclude_patterns)
-            
-            # Check for duplicate domains
-            is_duplicate = domain in excluded_domains
-            
-            # Apply filtering logic
-            if (is_career_url or is_career_title or has_career_content) and not is_excluded and not is_duplicate:
-                # Extract clean company name
-                company_name = self.extract_company_name(result['title'], result['url'])
-                
-                career_page = {
-                    "company_name": company_name,
-                    "title": result['title'],
-                    "career_url": result['url'],
-                    "description": result['snippet'],
-                    "domain": domain,
-                    "industry": criteria.get('industry', 'Unknown'),
-                    "company_size": criteria.get('company_size', 'Unknown'),
-                    "relevance_score": self.calculate_relevance_score(result, criteria)
-                }
-                
-                career_pages.append(career_page)
-                excluded_domains.add(domain)  # Prevent duplicates
+        # One union-regex scan per field; fields are checked separately so patterns cannot match across them
+        is_excluded = (
+            urls.str.contains(exclude_re)
+            | titles.str.contains(exclude_re)
+            | snippets.str.contains(exclude_re)
+        )
+        
+        # Score every row at once, then keep the first career-like, non-excluded result per domain
+        results_df['domain'] = results_df['url'].map(self.extract_domain)
+        results_df['relevance_score'] = self.relevance_scores(
+            urls, titles, snippets, results_df['position'].fillna(10), industry_words, size_terms
+        )
+        pages_df = (
+            results_df[is_career & ~is_excluded]
+            .drop_duplicates('domain')
+            .sort_values('relevance_score', ascending=False, kind='stable')
+            .iloc[:limit]
+        )
         
-        # Sort by relevance score
-        career_pages.sort(key=lambda x: x['relevance_score'], reverse=True)
+        career_pages = [
+            {
+                "company_name": self.extract_company_name(row.title, row.url),
+                "title": row.title,
+                "career_url": row.url,
+                "description": row.snippet,
+                "domain": row.domain,
+                "industry": industry,
+                "company_size": company_size,
+                "relevance_score": float(row.relevance_score)
+            }
+            for row in pages_df.itertuples(index=False)
+        ]
         
         st.success(f"🎯 **Local Filtering Complete!** Found {len(career_pages)} valid career pages")
         
         return career_pages
     
-    def calculate_relevance_score(self, result: Dict, criteria: Dict) -> float:
-        """Calculate relevance score for local sorting"""
-        score = 0.0
-        
-        url = result['url'].lower()
-        title = result['title'].lower()
-        snippet = result['snippet'].lower()
+    def size_indicator_terms(self, company_size: str) -> tuple:
+        """Return the title/snippet terms that signal the requested company size"""
+        company_size = company_size.lower()
+        if 'mnc' in company_size or 'large' in company_size:
+            return ('fortune', 'global', 'multinational', 'corporation')
+        elif 'startup' in company_size:
+            return ('startup', 'emerging', 'innovative', 'scale')
+        return ()
+    
+    def relevance_scores(self, urls: pd.Series, titles: pd.Series, snippets: pd.Series, positions: pd.Series,
+                         industry_words: List[str], size_terms: tuple) -> pd.Series:
+        """Calculate relevance scores for local sorting from already lower-cased url, title and snippet Series"""
+        def contains_any(series: pd.Series, terms) -> pd.Series:
+            if not terms:
+                return pd.Series(False, index=series.index)
+            return series.str.contains("|".join(map(re.escape, terms)))
         
-        # URL quality scoring
-        if 'careers.' in url or '/careers' in url:
-            score += 3.0
-        elif 'jobs.' in url or '/jobs' in url:
-            score += 2.5
-        elif any(keyword in url for keyword in ['hiring', 'employment', 'talent']):
-            score += 2.0
+        # URL quality scoring (later masks take precedence, so the best tier wins)
+        score = pd.Series(0.0, index=urls.index)
+        score = score.mask(contains_any(urls, ('hiring', 'employment', 'talent')), 2.0)
+        score = score.mask(contains_any(urls, ('jobs.', '/jobs')), 2.5)
+        score = score.mask(contains_any(urls, ('careers.', '/careers')), 3.0)
         
         # Title relevance scoring
-        industry = criteria.get('industry', '').lower()
-        if any(word in title for word in industry.split('&')):
-            score += 2.0
+        score += 2.0 * contains_any(titles, industry_words)
         
         # Company size indicators
-        company_size = criteria.get('company_size', '').lower()
-        if 'mnc' in company_size or 'large' in company_size:
-            if any(term in title or term in snippet for term in ['fortune', 'global', 'multinational', 'corporation']):
-                score += 1.5
-        elif 'startup' in company_size:
-            if any(term in title or term in snippet for term in ['startup', 'emerging', 'innovative', 'scale']):
-                score += 1.5
+        score += 1.5 * (contains_any(titles, size_terms) | contains_any(snippets, size_terms))
         
         # Domain authority indicators (simple heuristics)
-        if '.com' in url:
-            score += 0.5
-        if 'www.' in url:
-            score += 0.3
+        score += 0.5 * urls.str.contains('.com', regex=False)
+        score += 0.3 * urls.str.contains('www.', regex=False)
         
         # Position in search results (higher positions get slight boost)
-        position = result.get('position', 10)
-        score += max(0, (10 - position) * 0.1)
+        score += ((10 - positions).clip(lower=0) * 0.1)
         
         return score
     
-    def extract_company_name(self, title: str, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_company_name(title: str, url: str) -> str:
         """Extract company name from title or URL"""
         # Try to extract from title first
         if " - " in title:
@@ -385,7 +573,6 @@ class JobHunterApp:
         
         # Extract from domain
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             domain = parsed.netloc.lower()
             
@@ -400,117 +587,346 @@ class JobHunterApp:
         except:
             return "Unknown Company"
     
-    def extract_domain(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_domain(url: str) -> str:
         """Extract clean domain from URL"""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             domain = parsed.netloc.lower()
             return domain.replace("www.", "")
         except:
             return url
     
-    def filter_career_pages_with_llm(self, career_pages: List[Dict], criteria: Dict) -> List[Dict]:
-        """Use Azure OpenAI to filter and validate career pages based on criteria"""
-        if not self.azure_client or not career_pages:
-            if not self.azure_client:
-                st.warning("Azure OpenAI not configured. Returning unfiltered results.")
-            return career_pages
+    def _rank_career_chunk(self, chunk: List[Dict], criteria: Dict, on_pick: Callable[[List[int]], None]) -> Dict:
+        """Ask Azure OpenAI to validate one chunk of career pages and return its parsed JSON reply
+
+        Runs on a worker thread, so it reports the 1-based ids selected so far through on_pick instead of Streamlit.
+        """
+        # Prepare career pages as a compact JSON array; industry and size come from the criteria
+        candidates = [
+            {
+                "i": i,
+                "name": page['company_name'],
+                "d": page['domain'],
+                "t": page['title'],
+                "s": page['description'][:200],
+                "u": page['career_url']
+            }
+            for i, page in enumerate(chunk, 1)
+        ]
         
-        try:
-            # Prepare career pages data for LLM
-            pages_summary = []
-            for i, page in enumerate(career_pages[:100], 1):  # Limit for token efficiency
-                summary = f"""
-                Company {i}:
-                Name: {page['company_name']}
-                Domain: {page['domain']}
-                Title: {page['title']}
-                Description: {page['description'][:300]}
-                Industry: {page['industry']}
-                Size Category: {page['company_size']}
-                URL: {page['career_url']}
-                """
-                pages_summary.append(summary)
-            
-            # Create LLM prompt for filtering
-            prompt = f"""
-            You are an expert at evaluating company career pages. Please analyze these career page results and select only the most legitimate and relevant ones based on the following criteria:
-
-            FILTERING CRITERIA:
-            - Industry: {criteria.get('industry', 'Any')}
-            - Company Size: {criteria.get('company_size', 'Any')}
-            - Maximum Results Needed: {criteria.get('num_results', 20)}
-
-            VALIDATION REQUIREMENTS:
-            1. Must be actual company career pages (not job boards, recruiters, or aggregators)
-            2. Company name should be clearly identifiable and legitimate
-            3. Domain should belong to the actual company
-            4. Should match the requested industry and company size category
-            5. Remove duplicates (same company with different URLs)
-            6. Prioritize well-known, established companies
-
-            COMPANIES TO ANALYZE:
-            {chr(10).join(pages_summary[:50])}
-
-            Please return a JSON array with company numbers (1-based) that meet the criteria, ordered by relevance and company reputation.
-            Format: {{"selected_companies": [1, 3, 5, 7, ...], "reasoning": "Brief explanation of selection criteria applied"}}
-            Only return valid JSON, no additional text.
-            """
-
-            # Make Azure OpenAI API call
-            response = self.azure_client.chat.completions.create(
+        # Create LLM prompt for filtering
+        prompt = f"""
+        You are an expert at evaluating company career pages. Please analyze these career page results and select every one that is legitimate and relevant based on the following criteria:
+
+        FILTERING CRITERIA:
+        - Industry: {criteria.get('industry', 'Any')}
+        - Company Size: {criteria.get('company_size', 'Any')}
+
+        VALIDATION REQUIREMENTS:
+        1. Must be actual company career pages (not job boards, recruiters, or aggregators)
+        2. Company name should be clearly identifiable and legitimate
+        3. Domain should belong to the actual company
+        4. Should match the requested industry and company size category
+        5. Remove duplicates (same company with different URLs)
+        6. Prioritize well-known, established companies
+
+        COMPANIES TO ANALYZE (i=number, name=company, d=domain, t=page title, s=snippet, u=URL):
+        {json_dumps(candidates)}
+
+        Please return a JSON object listing every company number that meets the criteria, each with a 1-10 score for relevance and company reputation.
+        Format: {{"selected_companies": [{{"id": 1, "score": 9}}, {{"id": 3, "score": 7}}, ...], "reasoning": "Brief explanation of selection criteria applied"}}
+        """
+
+        system_prompt = "You are a professional HR and business analyst expert at identifying legitimate company career pages. Always respond with valid JSON only."
+        return self._stream_json_completion(system_prompt, prompt, 0.2, 1500, self.PICKED_COMPANY_ID_RE, on_pick)
+    
+    def _stream_json_completion(
+        self,
+        system_prompt: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        id_re: re.Pattern,
+        on_pick: Callable[[List[int]], None]
+    ) -> Dict:
+        """Stream a JSON-mode Azure OpenAI reply and return it parsed
+
+        Reports the ids matched by id_re's first group through on_pick as they arrive. Identical prompts reuse
+        the cached reply, and identical prompts requested concurrently share one Azure call.
+        """
+        cache_key = llm_cache_key(self.azure_openai_deployment, system_prompt, prompt)
+        if self.use_cached_results:
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        def complete() -> Dict:
+            # Make Azure OpenAI API call, streaming so picks show up as they are generated
+            stream = self.azure_client.chat.completions.create(
                 model=self.azure_openai_deployment,
                 messages=[
                     {
                         "role": "system", 
-                        "content": "You are a professional HR and business analyst expert at identifying legitimate company career pages. Always respond with valid JSON only."
+                        "content": system_prompt
                     },
                     {
                         "role": "user", 
                         "content": prompt
                     }
                 ],
-                temperature=0.2,
-                max_tokens=1000
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                stream=True
             )
             
-            result = response.choices[0].message.content.strip()
+            # Only the text after the last complete id is rescanned, and on_pick fires only for new ids
+            reply = ""
+            scan_from = 0
+            ids = []
+            for delta in stream:
+                if not delta.choices:  # Azure sends content-filter metadata chunks without choices
+                    continue
+                reply += delta.choices[0].delta.content or ""
+                found = len(ids)
+                for match in id_re.finditer(reply, scan_from):
+                    ids.append(int(match.group(1)))
+                    scan_from = match.end()
+                if len(ids) != found:
+                    on_pick(list(ids))
             
-            # Parse LLM response
-            try:
-                # Clean the response
-                if result.startswith("```json"):
-                    result = result[7:-3]
-                elif result.startswith("```"):
-                    result = result[3:-3]
-                
-                parsed_result = json.loads(result)
-                selected_indices = parsed_result.get("selected_companies", [])
-                reasoning = parsed_result.get("reasoning", "AI filtering applied")
-                
-                # Convert 1-based indices to 0-based and filter pages
-                filtered_pages = []
-                for idx in selected_indices:
-                    if 1 <= idx <= len(career_pages):
-                        filtered_pages.append(career_pages[idx-1])
-                
-                if filtered_pages:
-                    st.success(f"🤖 AI validated {len(filtered_pages)} legitimate career pages from {len(career_pages)} candidates")
-                    st.info(f"💡 AI Reasoning: {reasoning}")
-                    return filtered_pages[:criteria.get('num_results', 20)]
-                else:
-                    st.warning("AI filtering returned no valid results, showing top unfiltered results")
-                    return career_pages[:criteria.get('num_results', 20)]
+            return json_loads(reply)
+        
+        parsed_result = self.inflight.do(f"llm:{cache_key}", complete)
+        self.llm_cache.set(cache_key, parsed_result)
+        return parsed_result
+    
+    def _rank_in_chunks(
+        self,
+        items: List[Dict],
+        chunk_size: int,
+        rank_chunk: Callable[[List[Dict], Dict, Callable[[List[int]], None]], Dict],
+        criteria: Dict,
+        noun: str,
+        preview_columns: List[str]
+    ) -> List[tuple]:
+        """Rank items in concurrent chunks while previewing the picks streamed so far
+
+        Returns (offset, parsed reply) for every chunk whose reply could be parsed.
+        """
+        if not items:
+            return []
+        offsets = range(0, len(items), chunk_size)
+        
+        # Workers can't touch Streamlit, so they publish their picks for the main thread to preview
+        picks = {offset: [] for offset in offsets}
+        picks_lock = threading.Lock()
+        def on_pick(offset: int) -> Callable[[List[int]], None]:
+            def publish(ids: List[int]):
+                with picks_lock:
+                    picks[offset] = ids
+            return publish
+        
+        progress = st.empty()
+        previewed = None
+        with ThreadPoolExecutor(max_workers=min(5, len(offsets))) as executor:
+            futures = [
+                executor.submit(rank_chunk, items[offset:offset + chunk_size], criteria, on_pick(offset))
+                for offset in offsets
+            ]
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=0.5)
+                with picks_lock:
+                    picked = [
+                        items[offset + i - 1]
+                        for offset, ids in picks.items()
+                        for i in ids
+                        if 1 <= i <= min(chunk_size, len(items) - offset)
+                    ]
                 
+                # Redraw only when the pick count or finished batch count changed
+                finished = len(futures) - len(pending)
+                if (len(picked), finished) == previewed:
+                    continue
+                previewed = (len(picked), finished)
+                with progress.container():
+                    st.caption(f"🤖 AI has picked {len(picked)} {noun}, {finished}/{len(futures)} batches done...")
+                    if picked:
+                        st.dataframe(
+                            pd.DataFrame(picked, columns=preview_columns),
+                            hide_index=True,
+                            use_container_width=True
+                        )
+        progress.empty()
+        
+        # JSON mode guarantees a bare object, but it can still be truncated
+        results = []
+        for offset, future in zip(offsets, futures):
+            try:
+                results.append((offset, future.result()))
             except json.JSONDecodeError as e:
-                st.warning(f"AI response parsing failed: {str(e)}, returning unfiltered results")
-                return career_pages[:criteria.get('num_results', 20)]
+                st.warning(f"AI response parsing failed for one batch: {str(e)}")
+        return results
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def exclude_pattern(cls, excluded_keywords: tuple) -> re.Pattern:
+        """Compile the job-board patterns plus user exclude keywords into one alternation"""
+        return re.compile("|".join(re.escape(pattern) for pattern in cls.EXCLUDE_PATTERNS + excluded_keywords))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def root_domain(domain: str) -> str:
+        """Strip careers/jobs/www subdomains so variants of one company's site compare equal"""
+        for prefix in ("www.", "careers.", "jobs.", "career.", "job."):
+            domain = domain.removeprefix(prefix)
+        return domain
+    
+    def filter_career_pages_with_llm(self, career_pages: List[Dict], criteria: Dict) -> List[Dict]:
+        """Use Azure OpenAI to filter and validate career pages based on criteria"""
+        if not self.azure_client or not career_pages:
+            if not self.azure_client:
+                st.warning("Azure OpenAI not configured. Returning unfiltered results.")
+            return career_pages
+        
+        # Collapse careers./jobs. subdomains of the same company so the LLM doesn't spend tokens on them
+        seen_roots = set()
+        deduped_pages = []
+        for page in career_pages:
+            root = self.root_domain(page['domain'])
+            if root not in seen_roots:
+                seen_roots.add(root)
+                deduped_pages.append(page)
+        career_pages = deduped_pages
+        
+        # Reuse earlier per-URL verdicts for this industry/size (0 = rejected); only unseen pages go to the LLM
+        verdict_keys = [
+            f"{criteria.get('industry')}|{criteria.get('company_size')}|{page['career_url']}"
+            for page in career_pages
+        ]
+        verdicts = {}
+        if self.use_cached_results:
+            for idx, key in enumerate(verdict_keys):
+                score = self.career_verdicts.get(key)
+                if score is not None:
+                    verdicts[idx] = score
+        cached_count = len(verdicts)
+        num_results = criteria.get('num_results', 20)
+        
+        try:
+            # Skip the LLM entirely once cached verdicts already cover the requested number
+            if sum(1 for score in verdicts.values() if score > 0) >= num_results:
+                unknown = []
+            else:
+                unknown = [idx for idx in range(len(career_pages)) if idx not in verdicts]
+            
+            # Validate pages in chunks of 50 concurrently: few enough prompts to amortize the
+            # instructions, small enough that each reply fits comfortably in max_tokens
+            chunk_size = 50
+            ranked_chunks = self._rank_in_chunks(
+                [career_pages[idx] for idx in unknown],
+                chunk_size,
+                self._rank_career_chunk,
+                criteria,
+                "companies",
+                ["company_name", "domain"]
+            )
+            
+            reasonings = []
+            for offset, parsed_result in ranked_chunks:
+                batch = unknown[offset:offset + chunk_size]
+                # Convert chunk-local 1-based ids to indices into career_pages; unselected pages score 0
+                batch_scores = dict.fromkeys(batch, 0)
+                for item in parsed_result.get("selected_companies", []):
+                    idx, score = (item.get("id"), item.get("score", 1)) if isinstance(item, dict) else (item, 1)
+                    if isinstance(idx, int) and 1 <= idx <= len(batch):
+                        # Verdicts are cached, so never store a score that can't be compared
+                        try:
+                            score = float(score)
+                        except (TypeError, ValueError):
+                            score = 1.0  # Selected, but without a usable score
+                        batch_scores[batch[idx - 1]] = score
+                for idx, score in batch_scores.items():
+                    verdicts[idx] = score
+                    self.career_verdicts.set(verdict_keys[idx], score)
+                if parsed_result.get("reasoning"):
+                    reasonings.append(parsed_result["reasoning"])
+            
+            # Rank cached and fresh verdicts together by LLM score; ties keep the local relevance order
+            ranked = sorted((-score, idx) for idx, score in verdicts.items() if score > 0)
+            filtered_pages = [career_pages[idx] for _, idx in ranked]
+            
+            if filtered_pages:
+                cached_note = f" ({cached_count} from earlier verdicts)" if cached_count else ""
+                st.success(f"🤖 AI validated {len(filtered_pages)} legitimate career pages from {len(career_pages)} candidates{cached_note}")
+                st.info(f"💡 AI Reasoning: {' '.join(reasonings) or 'AI filtering applied'}")
+                return filtered_pages[:num_results]
+            else:
+                st.warning("AI filtering returned no valid results, showing top unfiltered results")
+                return career_pages[:num_results]
                 
         except Exception as e:
             st.error(f"AI filtering error: {str(e)}")
             return career_pages[:criteria.get('num_results', 20)]
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def term_pattern(term: str) -> re.Pattern:
+        """Return a compiled case-insensitive whole-word pattern for a search term"""
+        return re.compile(rf"(?<!\w){re.escape(term)}(?!\w)", re.I)
+    
+    def prefilter_jobs(self, jobs: List[Dict], criteria: Dict) -> List[Dict]:
+        """Return the jobs that match the position, employment type and work mode exactly (possibly none)"""
+        position_re = self.term_pattern(criteria.get('position', '').strip())
+        employment_type = criteria.get('employment_type', 'Any')
+        employment_term = "" if employment_type == "Any" else employment_type.lower()
+        remote_only = criteria.get('work_mode') == "Remote"
+        
+        kept = [
+            job for job in jobs
+            if position_re.search(f"{job['title']} {job['description']}")
+            and employment_term in f"{job.get('schedule_type', '')} {job['description']}".lower()
+            and (not remote_only or job.get('work_from_home'))
+        ]
+        
+        return kept
+    
+    def _rank_job_chunk(self, chunk: List[Dict], criteria: Dict, on_pick: Callable[[List[int]], None]) -> Dict:
+        """Ask Azure OpenAI to pick the best jobs from one chunk and return its parsed JSON reply
+
+        Runs on a worker thread, so it reports the 1-based picks made so far through on_pick instead of Streamlit.
+        """
+        # Prepare job data for GPT
+        prompt_jobs = "\n".join(
+            f"{i}|{job['title']}|{job['company']}|{job['location']}|{job.get('schedule_type', '')}|{'Remote' if job.get('work_from_home') else ''}|{job['description'][:180]}"
+            for i, job in enumerate(chunk, 1)
+        )
+        
+        # Create GPT prompt
+        prompt = f"""
+        You are a job recommendation expert. Please analyze these job listings and select the most relevant ones based on the following criteria:
+
+        Criteria:
+        - Position: {criteria.get('position', 'Any')}
+        - Employment Type: {criteria.get('employment_type', 'Any')}
+        - Work Mode: {criteria.get('work_mode', 'Any')}
+        - Experience Level: {criteria.get('experience_level', 'Any')}
+        - Location Preference: {criteria.get('location', 'Any')}
+        - Number of results wanted: {criteria.get('num_results', 10)}
+
+        Jobs to analyze (one per line: number|title|company|location|employment type|remote|description):
+        {prompt_jobs}
+
+        Please return a JSON object with job numbers that best match the criteria, ordered by relevance.
+        Format: {{"selected_jobs": [1, 3, 5, 7, ...]}}
+        """
+
+        system_prompt = "You are a helpful job matching assistant. Always respond with valid JSON only."
+        return self._stream_json_completion(system_prompt, prompt, 0.3, 500, self.PICKED_JOB_ID_RE, on_pick)
+    
     def filter_jobs_with_gpt(self, jobs: List[Dict], criteria: Dict) -> List[Dict]:
         """Use Azure OpenAI GPT to filter and rank jobs based on criteria"""
         if not self.azure_client or not jobs:
@@ -518,92 +934,61 @@ class JobHunterApp:
                 st.warning("Azure OpenAI not configured. Returning unfiltered results.")
             return jobs[:criteria.get('num_results', 10)]
         
+        kept = self.prefilter_jobs(jobs, criteria)
+        
+        # Fall through to the original list rather than hiding everything
+        candidates = kept or jobs
+        if kept and len(kept) < len(jobs):
+            st.info(f"⚡ Pre-filter kept {len(kept)} of {len(jobs)} jobs for AI ranking")
+        
+        # Nothing for the LLM to choose between when the exact checks cover every criterion and leave few enough;
+        # experience level can only be judged by the LLM, so it still ranks kept then
+        if (
+            kept
+            and len(kept) <= criteria.get('num_results', 10)
+            and criteria.get('experience_level', 'Any') == "Any"
+        ):
+            st.info(f"⚡ {len(kept)} jobs match the exact criteria, skipping AI ranking")
+            return kept
+        
         try:
-            # Prepare job data for GPT
-            job_summaries = []
-            for i, job in enumerate(jobs[:50]):  # Limit to first 50 jobs for API efficiency
-                summary = f"""
-                Job {i+1}:
-                Title: {job['title']}
-                Company: {job['company']}
-                Location: {job['location']}
-                Description: {job['description'][:500]}...
-                Employment Type: {job.get('schedule_type', 'Not specified')}
-                Remote: {job.get('work_from_home', 'Not specified')}
-                """
-                job_summaries.append(summary)
-            
-            # Create GPT prompt
-            prompt = f"""
-            You are a job recommendation expert. Please analyze these job listings and select the most relevant ones based on the following criteria:
-
-            Criteria:
-            - Position: {criteria.get('position', 'Any')}
-            - Employment Type: {criteria.get('employment_type', 'Any')}
-            - Work Mode: {criteria.get('work_mode', 'Any')}
-            - Experience Level: {criteria.get('experience_level', 'Any')}
-            - Location Preference: {criteria.get('location', 'Any')}
-            - Number of results wanted: {criteria.get('num_results', 10)}
-
-            Jobs to analyze:
-            {chr(10).join(job_summaries[:20])}  # Limit for token efficiency
-
-            Please return a JSON array with job numbers (1-based) that best match the criteria, ordered by relevance.
-            Format: {{"selected_jobs": [1, 3, 5, 7, ...]}}
-            Only return the JSON, no additional text.
-            """
-
-            # Make Azure OpenAI API call
-            response = self.azure_client.chat.completions.create(
-                model=self.azure_openai_deployment,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a helpful job matching assistant. Always respond with valid JSON only."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
+            # Rank candidates in chunks of 25 concurrently instead of truncating to one prompt
+            chunk_size = 25
+            ranked_chunks = []
+            for offset, parsed_result in self._rank_in_chunks(
+                candidates,
+                chunk_size,
+                self._rank_job_chunk,
+                criteria,
+                "jobs",
+                ["title", "company", "location"]
+            ):
+                # Convert chunk-local 1-based indices to indices into candidates
+                ranked_chunks.append([
+                    offset + idx - 1
+                    for idx in parsed_result.get("selected_jobs", [])
+                    if isinstance(idx, int) and 1 <= idx <= min(chunk_size, len(candidates) - offset)
+                ])
             
-            result = response.choices[0].message.content
+            # Interleave chunks by rank so each chunk's best picks come first
+            filtered_jobs = []
+            seen = set()
+            for rank in range(max(map(len, ranked_chunks), default=0)):
+                for ranked in ranked_chunks:
+                    if rank < len(ranked) and ranked[rank] not in seen:
+                        seen.add(ranked[rank])
+                        filtered_jobs.append(candidates[ranked[rank]])
             
-            # Parse GPT response
-            try:
-                # Clean the response to extract JSON
-                result = result.strip()
-                if result.startswith("```json"):
-                    result = result[7:-3]
-                elif result.startswith("```"):
-                    result = result[3:-3]
-                
-                parsed_result = json.loads(result)
-                selected_indices = parsed_result.get("selected_jobs", [])
-                
-                # Convert 1-based indices to 0-based and filter jobs
-                filtered_jobs = []
-                for idx in selected_indices:
-                    if 1 <= idx <= len(jobs):
-                        filtered_jobs.append(jobs[idx-1])
-                
-                if filtered_jobs:
-                    st.success(f"🤖 AI selected {len(filtered_jobs)} most relevant jobs from {len(jobs)} results")
-                    return filtered_jobs[:criteria.get('num_results', 10)]
-                else:
-                    st.warning("AI filtering returned no results, showing original results")
-                    return jobs[:criteria.get('num_results', 10)]
-                
-            except json.JSONDecodeError as e:
-                st.warning(f"AI response parsing failed: {str(e)}, returning original results")
-                return jobs[:criteria.get('num_results', 10)]
+            if filtered_jobs:
+                st.success(f"🤖 AI selected {len(filtered_jobs)} most relevant jobs from {len(jobs)} results")
+                return filtered_jobs[:criteria.get('num_results', 10)]
+            else:
+                st.warning("AI filtering returned no results, showing original results")
+                return candidates[:criteria.get('num_results', 10)]
                 
         except Exception as e:
             st.error(f"Azure OpenAI filtering error: {str(e)}")
-            return jobs[:criteria.get('num_results', 10)]
+            return candidates[:criteria.get('num_results', 10)]
     
     def display_jobs(self, jobs: List[Dict]):
         """Display job results in a formatted way"""
@@ -613,28 +998,26 @@ class JobHunterApp:
         
         st.markdown(f"### Found {len(jobs)} Jobs")
         
-        for i, job in enumerate(jobs, 1):
-            with st.container():
-                st.markdown(f"""
-                <div class="job-card">
-                    <h4>🎯 {job['title']}</h4>
-                    <p><strong>🏢 Company:</strong> {job['company']}</p>
-                    <p><strong>📍 Location:</strong> {job['location']}</p>
-                    <p><strong>🕒 Posted:</strong> {job.get('posted_at', 'Recently')}</p>
-                    <p><strong>💼 Type:</strong> {job.get('schedule_type', 'Not specified')}</p>
-                    <p><strong>🏠 Remote:</strong> {'Yes' if job.get('work_from_home') else 'Not specified'}</p>
-                    <p><strong>📝 Description:</strong> {job['description'][:200]}...</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                col1, col2 = st.columns([1, 1])
-                with col1:
-                    if job.get('link'):
-                        st.markdown(f"[🔗 Apply Now]({job['link']})")
-                with col2:
-                    st.markdown(f"*Via: {job.get('via', 'Direct')}*")
-                
-                st.divider()
+        # One virtualized grid instead of a markdown block per job
+        jobs_df = pd.DataFrame(jobs)[
+            ["title", "company", "location", "posted_at", "schedule_type", "work_from_home", "via", "link", "description"]
+        ]
+        st.dataframe(
+            jobs_df,
+            column_config={
+                "title": st.column_config.TextColumn("🎯 Title"),
+                "company": st.column_config.TextColumn("🏢 Company"),
+                "location": st.column_config.TextColumn("📍 Location"),
+                "posted_at": st.column_config.TextColumn("🕒 Posted"),
+                "schedule_type": st.column_config.TextColumn("💼 Type"),
+                "work_from_home": st.column_config.CheckboxColumn("🏠 Remote"),
+                "via": st.column_config.TextColumn("Via"),
+                "link": st.column_config.LinkColumn("Apply", display_text="🔗 Apply Now"),
+                "description": st.column_config.TextColumn("📝 Description", width="large")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
     
     def display_career_pages(self, career_pages: List[Dict]):
         """Display filtered career page results"""
@@ -644,35 +1027,42 @@ class JobHunterApp:
         
         st.markdown(f"### 🎯 {len(career_pages)} Validated Career Pages")
         
+        # Tabular view of the results, shared by the summary metrics and Table View
+        df = career_pages_table(career_pages)
+        
         # Display summary metrics
         col1, col2, col3 = st.columns(3)
         with col1:
-            unique_domains = len(set(page['domain'] for page in career_pages))
-            st.metric("🌐 Unique Domains", unique_domains)
+            st.metric("🌐 Unique Domains", df['Domain'].nunique())
         with col2:
-            industries = set(page['industry'] for page in career_pages)
-            st.metric("🏭 Industries", len(industries))
+            st.metric("🏭 Industries", df['Industry'].nunique())
         with col3:
-            company_sizes = set(page['company_size'] for page in career_pages)
-            st.metric("📊 Company Types", len(company_sizes))
+            st.metric("📊 Company Types", df['Size'].nunique())
         
         # Display options
-        display_mode = st.radio("Display Mode", ["Cards View", "Table View"], horizontal=True)
+        display_mode = st.radio("Display Mode", ["Grouped View", "Table View"], horizontal=True)
         
-        if display_mode == "Cards View":
+        if display_mode == "Grouped View":
             # Group by industry or company size
             group_by = st.selectbox("Group by", ["Industry", "Company Size"], key="group_career")
             
+            # Only render one page of companies at a time to keep the DOM and rerun diff small
+            page_size = 20
+            num_pages = (len(career_pages) + page_size - 1) // page_size
+            page_number = st.number_input("Page", min_value=1, max_value=num_pages, step=1, key="cp_page") if num_pages > 1 else 1
+            visible_pages = career_pages[(page_number - 1) * page_size:page_number * page_size]
+            st.caption(f"Showing {(page_number - 1) * page_size + 1}-{(page_number - 1) * page_size + len(visible_pages)} of {len(career_pages)} companies")
+            
             if group_by == "Industry":
                 grouped = {}
-                for page in career_pages:
+                for page in visible_pages:
                     industry = page['industry']
                     if industry not in grouped:
                         grouped[industry] = []
                     grouped[industry].append(page)
             else:
                 grouped = {}
-                for page in career_pages:
+                for page in visible_pages:
                     size = page['company_size']
                     if size not in grouped:
                         grouped[size] = []
@@ -680,47 +1070,46 @@ class JobHunterApp:
             
             for group_name, pages in grouped.items():
                 with st.expander(f"📁 {group_name} ({len(pages)} companies)", expanded=True):
-                    for page in pages:
-                        st.markdown(f"""
-                        <div class="company-card">
-                            <h5>🏢 {page['company_name']}</h5>
-                            <p><strong>🌐 Domain:</strong> {page['domain']}</p>
-                            <p><strong>🏭 Industry:</strong> {page['industry']}</p>
-                            <p><strong>📊 Size:</strong> {page['company_size']}</p>
-                            <p><strong>📝 Description:</strong> {page['description'][:200]}...</p>
-                            <p><a href="{page['career_url']}" target="_blank">🔗 Visit Career Page</a></p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        st.markdown("---")
+                    group_df = pd.DataFrame(pages)[
+                        ['company_name', 'domain', 'industry', 'company_size', 'description', 'career_url']
+                    ]
+                    st.dataframe(
+                        group_df,
+                        column_config={
+                            "company_name": st.column_config.TextColumn("🏢 Company"),
+                            "domain": st.column_config.TextColumn("🌐 Domain"),
+                            "industry": st.column_config.TextColumn("🏭 Industry"),
+                            "company_size": st.column_config.TextColumn("📊 Size"),
+                            "description": st.column_config.TextColumn("📝 Description", width="large"),
+                            "career_url": st.column_config.LinkColumn("Visit", display_text="🔗 Career Page")
+                        },
+                        hide_index=True,
+                        use_container_width=True
+                    )
         else:
             # Table view
-            df_data = []
-            for page in career_pages:
-                df_data.append({
-                    "Company": page['company_name'],
-                    "Domain": page['domain'],
-                    "Industry": page['industry'],
-                    "Size": page['company_size'].split(" (")[0],  # Shorter display
-                    "Career URL": page['career_url']
-                })
-            
-            df = pd.DataFrame(df_data)
-            
-            # Add filtering options for table
+            
+            # Add filtering options for table; the categorical columns already know their distinct values
+            industries = df['Industry'].cat.categories.tolist()
+            sizes = df['Size'].cat.categories.tolist()
             col1, col2 = st.columns(2)
             with col1:
-                industry_filter = st.multiselect("Filter by Industry", df['Industry'].unique(), key="industry_filter")
+                industry_filter = st.multiselect("Filter by Industry", industries, key="industry_filter")
             with col2:
-                size_filter = st.multiselect("Filter by Size", df['Size'].unique(), key="size_filter")
+                size_filter = st.multiselect("Filter by Size", sizes, key="size_filter")
             
-            # Apply filters
-            filtered_df = df.copy()
+            # Apply filters as one combined mask so the table is indexed once
+            mask = pd.Series(True, index=df.index)
             if industry_filter:
-                filtered_df = filtered_df[filtered_df['Industry'].isin(industry_filter)]
+                mask &= df['Industry'].isin(industry_filter)
             if size_filter:
-                filtered_df = filtered_df[filtered_df['Size'].isin(size_filter)]
+                mask &= df['Size'].isin(size_filter)
             
-            st.dataframe(filtered_df, use_container_width=True)
+            st.dataframe(
+                df[mask],
+                column_config={"Career URL": st.column_config.LinkColumn("Career URL")},
+                use_container_width=True
+            )
         
         # Export options
         st.markdown("### 📥 Export Options")
@@ -728,69 +1117,84 @@ class JobHunterApp:
         
         with col1:
             if st.button("📋 Copy Career URLs"):
-                urls = "\n".join([page['career_url'] for page in career_pages])
+                urls = "\n".join(df['Career URL'].to_numpy())
                 st.code(urls, language="text")
         
         with col2:
             # Download as CSV
-            df_export = pd.DataFrame(career_pages)
-            csv = df_export.to_csv(index=False)
             st.download_button(
                 label="💾 Download as CSV",
-                data=csv,
+                data=career_pages_csv(career_pages),
                 file_name=f"career_pages_{len(career_pages)}_results.csv",
                 mime="text/csv"
             )
     
     def run(self):
         """Main application runner"""
+        # Custom CSS
+        st.markdown(CSS, unsafe_allow_html=True)
+        
         st.markdown('<h1 class="main-header">🔍 Job Hunter Pro</h1>', unsafe_allow_html=True)
         
+        with st.sidebar:
+            self.use_cached_results = st.checkbox(
+                "♻️ Use cached results",
+                value=True,
+                help="Reuse results of identical recent searches and AI selections. Untick to always fetch fresh data."
+            )
+            if st.button("🧹 Clear Cache", help="Discard cached search results and AI selections"):
+                get_http_session().cache.clear()
+                _serp_jobs_raw.clear()
+                _serp_career_raw.clear()
+                get_llm_cache().clear()
+                get_career_verdicts().clear()
+                st.success("SERP and AI caches cleared")
+        
         # Main tabs
         tab1, tab2 = st.tabs(["🎯 Job Search", "🏢 Company Career Pages"])
         
         with tab1:
             st.header("Smart Job Search")
             
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                position = st.text_input("Position/Job Title", placeholder="Software Engineer, Data Scientist, etc.")
-                location = st.text_input("Location", placeholder="San Francisco, Remote, etc.")
-            
-            with col2:
-                employment_type = st.selectbox("Employment Type", ["Any"] + self.employment_types)
-                work_mode = st.selectbox("Work Mode", ["Any"] + self.work_modes)
-            
-            col3, col4 = st.columns([1, 1])
-            with col3:
-                experience_level = st.selectbox("Experience Level", ["Any"] + self.experience_levels)
-            with col4:
-                num_results = st.slider("Number of Results", 5, 100, 20)
-            
-            use_gpt_filtering = st.checkbox("🤖 Use AI-Powered Job Filtering", value=True, 
-                                          help="Uses Azure OpenAI GPT to intelligently filter jobs based on your criteria")
+            # One form so typing and toggling inputs doesn't rerun the app until the search is submitted
+            with st.form("job_search"):
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    position = st.text_input("Position/Job Title", placeholder="Software Engineer, Data Scientist, etc.")
+                    location = st.text_input("Location", placeholder="San Francisco, Remote, etc.")
+                
+                with col2:
+                    employment_type = st.selectbox("Employment Type", ["Any", *self.EMPLOYMENT_TYPES])
+                    work_mode = st.selectbox("Work Mode", ["Any", *self.WORK_MODES])
+                
+                col3, col4 = st.columns([1, 1])
+                with col3:
+                    experience_level = st.selectbox("Experience Level", ["Any", *self.EXPERIENCE_LEVELS])
+                with col4:
+                    num_results = st.slider("Number of Results", 5, 100, 20)
+                
+                use_gpt_filtering = st.checkbox("🤖 Use AI-Powered Job Filtering", value=True, 
+                                              help="Uses Azure OpenAI GPT to intelligently filter jobs based on your criteria")
+                
+                search_jobs = st.form_submit_button("🔍 Search Jobs", type="primary")
             
-            if st.button("🔍 Search Jobs", type="primary"):
+            if search_jobs:
                 if not position:
                     st.error("Please enter a position/job title")
                     return
                 
                 with st.spinner("Searching for jobs..."):
-                    # Build search query
-                    query_parts = [position]
-                    if employment_type != "Any":
-                        query_parts.append(employment_type.lower())
-                    if work_mode == "Remote":
-                        query_parts.append("remote")
-                    
-                    query = " ".join(query_parts)
+                    # Build search query; stray whitespace and case shouldn't miss the cache
+                    query = self.canonical_query(position, employment_type, work_mode)
+                    location = " ".join(location.split())
                     
-                    # Search jobs
-                    jobs = self.search_serp_jobs(query, location, num_results)
+                    # Search jobs; AI ranking only ever looks at a bounded candidate pool
+                    limit = max(num_results, min(num_results * 3, 50)) if use_gpt_filtering else num_results
+                    jobs = self.search_serp_jobs(query, location, num_results, limit=limit)
                     
                     if jobs and use_gpt_filtering:
-                        with st.spinner("AI is filtering the best matches for you..."):
+                        with st.status("AI is filtering the best matches for you...", expanded=True) as status:
                             criteria = {
                                 "position": position,
                                 "employment_type": employment_type,
@@ -800,6 +1204,7 @@ class JobHunterApp:
                                 "num_results": num_results
                             }
                             jobs = self.filter_jobs_with_gpt(jobs, criteria)
+                            status.update(label=f"AI picked {len(jobs)} jobs", state="complete", expanded=False)
                     
                     # Display results
                     self.display_jobs(jobs)
@@ -808,51 +1213,55 @@ class JobHunterApp:
             st.header("Industry Career Pages Discovery")
             st.markdown("*Automatically discover career pages from companies in specific industries*")
             
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                selected_industry = st.selectbox(
-                    "🏭 Select Industry Domain",
-                    self.industry_domains,
-                    help="Choose the industry to discover career pages from"
-                )
+            with st.form("career_search"):
+                col1, col2 = st.columns([2, 1])
                 
-                selected_company_size = st.selectbox(
-                    "📊 Company Size Preference", 
-                    self.company_sizes,
-                    help="Choose between large corporations or startups"
-                )
-            
-            with col2:
-                num_career_results = st.slider("🎯 Number of Companies", 10, 100, 30, step=5)
-                
-                use_ai_validation = st.checkbox(
-                    "🤖 AI Career Page Validation", 
-                    value=True,
-                    help="Use AI to validate and filter legitimate career pages"
-                )
-            
-            # Advanced options in expandable section
-            with st.expander("⚙️ Advanced Search Options"):
-                col3, col4 = st.columns(2)
-                with col3:
-                    location_filter = st.text_input(
-                        "🌍 Location Focus (Optional)",
-                        placeholder="USA, Europe, Global, etc.",
-                        help="Add location preference to the search"
+                with col1:
+                    selected_industry = st.selectbox(
+                        "🏭 Select Industry Domain",
+                        self.INDUSTRY_DOMAINS,
+                        help="Choose the industry to discover career pages from"
                     )
-                with col4:
-                    exclude_keywords = st.text_input(
-                        "🚫 Exclude Keywords (Optional)", 
-                        placeholder="recruiter, consultant, agency",
-                        help="Keywords to exclude from results"
+                    
+                    selected_company_size = st.selectbox(
+                        "📊 Company Size Preference", 
+                        self.COMPANY_SIZES,
+                        help="Choose between large corporations or startups"
+                    )
+                
+                with col2:
+                    num_career_results = st.slider("🎯 Number of Companies", 10, 100, 30, step=5)
+                    
+                    use_ai_validation = st.checkbox(
+                        "🤖 AI Career Page Validation", 
+                        value=True,
+                        help="Use AI to validate and filter legitimate career pages"
                     )
+                
+                # Advanced options in expandable section
+                with st.expander("⚙️ Advanced Search Options"):
+                    col3, col4 = st.columns(2)
+                    with col3:
+                        location_filter = st.text_input(
+                            "🌍 Location Focus (Optional)",
+                            placeholder="USA, Europe, Global, etc.",
+                            help="Add location preference to the search"
+                        )
+                    with col4:
+                        exclude_keywords = st.text_input(
+                            "🚫 Exclude Keywords (Optional)", 
+                            placeholder="recruiter, consultant, agency",
+                            help="Keywords to exclude from results"
+                        )
+                
+                discover_pages = st.form_submit_button("🔍 Discover Career Pages", type="primary")
             
-            if st.button("🔍 Discover Career Pages", type="primary"):
+            if discover_pages:
                 if not selected_industry:
                     st.error("Please select an industry domain")
                     return
                 
+                location_filter = " ".join(location_filter.split())
                 search_criteria = {
                     "industry": selected_industry,
                     "company_size": selected_company_size,
@@ -871,34 +1280,50 @@ class JobHunterApp:
                     )
 
                     if raw_results:
-                        # Step 2: Local filtering to isolate career pages
-                        filtered_pages = self.filter_career_pages_locally(raw_results, search_criteria)
+                        # Step 2: Local filtering to isolate career pages; without AI only the top results are kept
+                        validate_with_ai = use_ai_validation and self.azure_client is not None
+                        final_pages = self.filter_career_pages_locally(
+                            raw_results, search_criteria, limit=None if validate_with_ai else num_career_results
+                        )
 
                         # Step 3: AI validation if enabled
-                        if use_ai_validation and self.azure_client:
+                        if validate_with_ai:
                             with st.spinner("🤖 AI is validating career pages and removing duplicates..."):
-                                final_pages = self.filter_career_pages_with_llm(filtered_pages, search_criteria)
-                        else:
-                            final_pages = filtered_pages[:num_career_results]
+                                final_pages = self.filter_career_pages_with_llm(final_pages, search_criteria)
 
-                        # Step 4: Display results
+                        # Step 4: Keep results for display across reruns
                         if final_pages:
-                            self.display_career_pages(final_pages)
-                            st.markdown("---")
-                            st.markdown("### 📊 Search Summary")
-                            col_sum1, col_sum2, col_sum3 = st.columns(3)
-                            with col_sum1:
-                                st.metric("🔍 Raw Results Found", len(raw_results))
-                            with col_sum2:
-                                st.metric("✅ AI Validated Results", len(final_pages) if use_ai_validation else "N/A")
-                            with col_sum3:
-                                accuracy = f"{(len(final_pages)/len(raw_results)*100):.1f}%" if raw_results else "0%"
-                                st.metric("🎯 Filter Accuracy", accuracy)
+                            # Summary values only change with a new search, so compute them once here
+                            st.session_state["career_search"] = {
+                                "pages": final_pages,
+                                "summary": (
+                                    len(raw_results),
+                                    len(final_pages) if validate_with_ai else "N/A",
+                                    f"{len(final_pages) / len(raw_results) * 100:.1f}%"
+                                )
+                            }
+                            st.session_state.pop("cp_page", None)  # Start a new result set on page 1
                         else:
+                            st.session_state.pop("career_search", None)
                             st.warning("No career pages found matching your criteria. Try adjusting your search parameters.")
                     else:
+                        st.session_state.pop("career_search", None)
                         st.error("No career pages discovered. Please try a different industry or search criteria.")
-
+            
+            # Render from session state so paging, grouping and view toggles don't discard the results
+            career_search = st.session_state.get("career_search")
+            if career_search:
+                self.display_career_pages(career_search["pages"])
+                st.markdown("---")
+                st.markdown("### 📊 Search Summary")
+                raw_count, validated_count, accuracy = career_search["summary"]
+                col_sum1, col_sum2, col_sum3 = st.columns(3)
+                with col_sum1:
+                    st.metric("🔍 Raw Results Found", raw_count)
+                with col_sum2:
+                    st.metric("✅ AI Validated Results", validated_count)
+                with col_sum3:
+                    st.metric("🎯 Filter Accuracy", accuracy)
             
             # Show example searches
             with st.expander("💡 Example Search Combinations"):